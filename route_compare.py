@@ -23,13 +23,141 @@ import json
 import csv
 import argparse
 import ipaddress
-from typing import Dict, List, Set, Tuple, Optional
+import socket
+from typing import Dict, Iterable, List, Set, Tuple, Optional
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import os
 import sys
 
 
-@dataclass
+def _compile(pattern: str):
+    """Compile an ASCII-only pattern; route dumps never contain Unicode"""
+    return re.compile(pattern, re.ASCII)
+
+
+try:
+    # orjson parses large API dumps several times faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(content: str):
+    """Decode JSON with orjson when available, falling back to the stdlib.
+    
+    orjson rejects some input json.loads accepts (NaN/Infinity, integers of
+    2**64 and above), so any orjson failure is retried with json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+# Nexus route header (destination line):
+# 10.7.248.0/30, ubest/mbest: 2/0
+_NEXUS_HEADER_RE = _compile(
+    r'^(?P<dest>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+),\s+ubest/mbest:\s*\d+/\d+'
+)
+
+# Nexus via lines (next-hop details). A single pattern covers the three
+# layouts seen in the wild; the interface is optional and the VRF suffix
+# only appears on overlay next-hops:
+# *via 10.249.16.64, eth1/54.12, [115/64], 04w00d, isis-isis_infra, isis-l1-ext
+# *via 10.249.248.0%overlay-1, [1/0], 28w06d, bgp-64512, internal, tag 64512
+# *via 192.168.63.253, vlan27, [0/0], 3y34w, local, local
+_NEXUS_VIA_RE = _compile(
+    r'^\s*\*via\s+(?P<nh>\d+\.\d+\.\d+\.\d+)(?:%(?P<vrf>\S+))?,\s*'
+    r'(?:(?P<intf>\S+),\s*)?'
+    r'\[(?P<ad>\d+)/(?P<metric>\d+)\],\s*(?P<age>\S+),\s*(?P<protocol>\S+)'
+)
+
+# Legacy patterns for other Cisco formats
+_CISCO_ROUTE_RES = [_compile(p) for p in (
+    # Standard format: network/prefix via next_hop, interface
+    r'(?P<protocol>[A-Z*+]?\s*)?(?P<dest>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)\s+via\s+(?P<nh>\d+\.\d+\.\d+\.\d+)(?:,\s*(?P<intf>\S+))?',
+    # Alternative format with brackets: network/prefix [AD/metric] via next_hop, interface
+    r'(?P<protocol>[A-Z*+]?\s*)?(?P<dest>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)\s+\[(?P<ad>\d+)/(?P<metric>\d+)\]\s+via\s+(?P<nh>\d+\.\d+\.\d+\.\d+)(?:,\s*\d+:\d+:\d+,\s*(?P<intf>\S+))?',
+    # Simple format: network/prefix next_hop
+    r'(?P<dest>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)\s+(?P<nh>\d+\.\d+\.\d+\.\d+)',
+)]
+
+# Any IPv4 address, optionally with a prefix length
+_GENERIC_IP_RE = _compile(r'\b(?:\d{1,3}\.){3}\d{1,3}(?:/\d{1,2})?\b')
+
+# Cheap prefilter: every text route pattern contains an IPv4-like token
+_ROUTE_HINT_RE = _compile(r'\d+\.\d+\.\d+\.\d+')
+
+# Comments, prompts and commands echoed in show ip route dumps
+_TEXT_SKIP_PREFIXES = ('#', '!', 'Leaf-', 'show ')
+
+# Header lines and VRF separators, matched in one pass over the line
+_TEXT_SKIP_RE = _compile('|'.join(re.escape(fragment) for fragment in (
+    'IP Route Table for VRF',
+    "'*' denotes best ucast next-hop",
+    "'**' denotes best mcast next-hop",
+    "'[x/y]' denotes [preference/metric]",
+    "'%<string>' in via output denotes VRF",
+    'Total entries displayed:',
+    'Capability codes:',
+)))
+
+# Number of characters read from the head of a file to detect its format
+_FORMAT_SAMPLE_SIZE = 4096
+
+# Keys recognised in dict-based (JSON/CSV) route records, in priority order
+_ROUTE_FIELD_ALIASES = {
+    'destination': ('destination', 'network', 'dest', 'subnet', 'prefix'),
+    'mask': ('mask', 'prefix_length', 'prefixlen', 'netmask'),
+    'next_hop': ('next_hop', 'nexthop', 'gateway', 'via'),
+    'interface': ('interface', 'intf', 'egress_intf', 'outgoing_interface'),
+    'protocol': ('protocol', 'proto', 'source'),
+}
+
+# Record key -> (attribute, priority) for one-pass lookup
+_ROUTE_FIELD_LOOKUP = {
+    alias: (attr, rank)
+    for attr, aliases in _ROUTE_FIELD_ALIASES.items()
+    for rank, alias in enumerate(aliases)
+}
+
+# Combined input size above which pre/post files are parsed in parallel;
+# below it, worker start-up and pickling the routes back cost more than
+# they save
+_PARALLEL_PARSE_MIN_BYTES = 4 * 1024 * 1024
+
+# IPv4 network masks indexed by prefix length
+_IPV4_PREFIX_MASKS = [(0xFFFFFFFF << (32 - p)) & 0xFFFFFFFF for p in range(33)]
+
+# Dotted-quad netmask -> prefix length, e.g. '255.255.255.0' -> 24
+_NETMASK_PREFIXES = {
+    str(ipaddress.IPv4Address(mask)): prefix for prefix, mask in enumerate(_IPV4_PREFIX_MASKS)
+}
+
+
+def _ipv4_network(destination: str, prefix_length: int) -> Optional[int]:
+    """Return the IPv4 network of destination/prefix_length as an integer, or None"""
+    if not 0 <= prefix_length <= 32:
+        return None
+    try:
+        # inet_pton is as strict as ipaddress (exactly four decimal octets,
+        # no leading zeros) but runs in C
+        address = int.from_bytes(socket.inet_pton(socket.AF_INET, destination), 'big')
+    except (OSError, ValueError):
+        return None
+    return address & _IPV4_PREFIX_MASKS[prefix_length]
+
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Route:
     """Represents a network route with all relevant information"""
     destination: str
@@ -40,24 +168,45 @@ class Route:
     metric: Optional[int] = None
     admin_distance: Optional[int] = None
     raw_line: Optional[str] = None
+    # Hashable subnet identity used by RouteComparator, set in __post_init__
+    _key: tuple = field(init=False, repr=False, compare=False)
+    # (next_hop, interface, protocol) identity of the path, set in __post_init__
+    _nh_key: tuple = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Normalize the destination subnet and protocol"""
-        try:
-            # Ensure destination is in CIDR format
-            network = ipaddress.ip_network(f"{self.destination}/{self.prefix_length}", strict=False)
-            self.destination = str(network.network_address)
-        except (ipaddress.AddressValueError, ValueError):
-            # Keep original if parsing fails
-            pass
-        
-        # Normalize protocol field by removing trailing punctuation
+        # IPv4 fast path: mask the integer address and key on (network, prefix).
+        # Nexus via lines arrive without a destination (the parser fills it
+        # in from the header line), so there is nothing to normalize for them.
+        network = _ipv4_network(self.destination, self.prefix_length) if self.destination else None
+        if network is not None:
+            self.destination = socket.inet_ntoa(network.to_bytes(4, 'big'))
+            self._key = (network, self.prefix_length)
+        else:
+            if self.destination:
+                try:
+                    # Ensure destination is in CIDR format
+                    network = ipaddress.ip_network(f"{self.destination}/{self.prefix_length}", strict=False)
+                    self.destination = str(network.network_address)
+                except (ipaddress.AddressValueError, ValueError):
+                    # Keep original if parsing fails
+                    pass
+            self._key = (self.destination, self.prefix_length)
+        
+        # Normalize protocol field by removing trailing punctuation. Protocols
+        # and interfaces repeat across thousands of routes, so intern them to
+        # share one string object per distinct value.
         if self.protocol:
-            self.protocol = self.protocol.rstrip(',]')
+            self.protocol = sys.intern(self.protocol.rstrip(',]'))
         
         # Normalize VLAN interfaces for comparison purposes
-        if self.interface and self.interface.lower().startswith('vlan'):
-            self.interface = 'vlan'
+        if self.interface:
+            if self.interface.lower().startswith('vlan'):
+                self.interface = 'vlan'
+            else:
+                self.interface = sys.intern(self.interface)
+        
+        self._nh_key = (self.next_hop, self.interface, self.protocol)
     
     @property
     def subnet(self) -> str:
@@ -83,22 +232,25 @@ class RouteParser:
             raise FileNotFoundError(f"Route file not found: {file_path}")
         
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Try different parsing methods
-        if content.strip().startswith('{') or content.strip().startswith('['):
-            return RouteParser._parse_json(content)
-        elif ',' in content and ('Destination' in content or 'Network' in content):
-            return RouteParser._parse_csv(file_path)
-        else:
-            return RouteParser._parse_text(content)
+            # Detect the format from the head of the file so that text dumps
+            # can be streamed line by line instead of read into memory
+            sample = f.read(_FORMAT_SAMPLE_SIZE)
+            f.seek(0)
+            
+            # Try different parsing methods
+            if sample.strip().startswith('{') or sample.strip().startswith('['):
+                return RouteParser._parse_json(f.read())
+            elif ',' in sample and ('Destination' in sample or 'Network' in sample):
+                return RouteParser._parse_csv(file_path)
+            else:
+                return RouteParser._parse_text_iter(f)
     
     @staticmethod
     def _parse_json(content: str) -> List[Route]:
         """Parse JSON format route files"""
         routes = []
         try:
-            data = json.loads(content)
+            data = _json_loads(content)
             
             # Handle different JSON structures
             route_data = data
@@ -147,33 +299,38 @@ class RouteParser:
         return routes
     
     @staticmethod
-    def _parse_text(content: str) -> List[Route]:
-        """Parse text format route files (show ip route output)"""
+    def _parse_text_iter(lines: Iterable[str]) -> List[Route]:
+        """Parse text format route lines (show ip route output)"""
         routes = []
-        lines = content.split('\n')
-        current_destination = None
-        current_prefix = None
+        current_header = None
+        # Set once a Nexus route header is seen. The rest of the dump is then
+        # NX-OS output, so header and via lines are matched directly and only
+        # lines that are neither go through the filters and other formats.
+        nexus_dialect = False
         
-        for i, line in enumerate(lines):
+        for line in lines:
             line = line.strip()
-            if not line or line.startswith('#') or line.startswith('!'):
+            if not line or line.startswith(_TEXT_SKIP_PREFIXES):
                 continue
             
-            # Skip header lines and VRF separators
-            if ('IP Route Table for VRF' in line or 
-                "'*' denotes best ucast next-hop" in line or
-                "'**' denotes best mcast next-hop" in line or
-                "'[x/y]' denotes [preference/metric]" in line or
-                "'%<string>' in via output denotes VRF" in line or
-                line.startswith('Leaf-') or
-                line.startswith('show ') or
-                'Total entries displayed:' in line or
-                'Capability codes:' in line):
-                continue
-            
-            # Try different text parsing patterns
-            route = (RouteParser._parse_cisco_route_line(line) or
-                    RouteParser._parse_generic_route_line(line))
+            route = RouteParser._parse_nexus_route_line(line) if nexus_dialect else None
+            if route is None:
+                # Every route format carries a dotted quad; drop everything else
+                # (most of a multi-command artifact dump) before heavier matching
+                if not _ROUTE_HINT_RE.search(line):
+                    continue
+                
+                # Skip header lines and VRF separators
+                if _TEXT_SKIP_RE.search(line):
+                    continue
+                
+                # Try different text parsing patterns; in the Nexus dialect the
+                # Nexus matcher has already been tried above
+                if nexus_dialect:
+                    route = RouteParser._parse_legacy_route_line(line)
+                else:
+                    route = RouteParser._parse_cisco_route_line(line)
+                route = route or RouteParser._parse_generic_route_line(line)
             
             if route:
                 # Skip ISIS infrastructure routes
@@ -181,43 +338,48 @@ class RouteParser:
                     continue
                 # Check if this is a Nexus route header (destination only)
                 if route.destination and route.prefix_length and not route.next_hop:
-                    current_destination = route.destination
-                    current_prefix = route.prefix_length
+                    current_header = route
+                    if not nexus_dialect and 'ubest/mbest' in line:
+                        nexus_dialect = True
                     continue
                 
                 # Check if this is a via line without destination (Nexus format)
-                elif route.next_hop and not route.destination and current_destination:
-                    route.destination = current_destination
-                    route.prefix_length = current_prefix
+                elif route.next_hop and not route.destination and current_header:
+                    route.destination = current_header.destination
+                    route.prefix_length = current_header.prefix_length
+                    route._key = current_header._key
                     routes.append(route)
                 
                 # Regular complete route entry
                 elif route.destination and route.prefix_length:
                     routes.append(route)
-                    current_destination = None
-                    current_prefix = None
+                    current_header = None
         
         return routes
     
     @staticmethod
     def _parse_route_dict(data: dict) -> Optional[Route]:
         """Parse a dictionary containing route information"""
-        # Common field mappings
-        dest_fields = ['destination', 'network', 'dest', 'subnet', 'prefix']
-        mask_fields = ['mask', 'prefix_length', 'prefixlen', 'netmask']
-        nh_fields = ['next_hop', 'nexthop', 'gateway', 'via']
-        int_fields = ['interface', 'intf', 'egress_intf', 'outgoing_interface']
-        proto_fields = ['protocol', 'proto', 'source']
-        
-        destination = None
+        # Collect candidate fields in a single pass over the record. When
+        # several aliases of the same attribute are present the one listed
+        # first in _ROUTE_FIELD_ALIASES wins.
+        found = {}
+        masks = []
+        for key, value in data.items():
+            slot = _ROUTE_FIELD_LOOKUP.get(key)
+            if slot is None:
+                continue
+            attr, rank = slot
+            if attr == 'mask':
+                if value is not None:
+                    masks.append((rank, value))
+            elif value and (attr not in found or rank < found[attr][0]):
+                found[attr] = (rank, value)
+        
+        values = {attr: str(value).strip() for attr, (rank, value) in found.items()}
+        destination = values.get('destination')
         prefix_length = None
         
-        # Find destination
-        for field in dest_fields:
-            if field in data and data[field]:
-                destination = str(data[field]).strip()
-                break
-        
         if not destination:
             return None
         
@@ -236,39 +398,26 @@ class RouteParser:
                     prefix_length = 32
         else:
             # Look for separate mask field
-            for field in mask_fields:
-                if field in data and data[field] is not None:
-                    try:
-                        mask_val = str(data[field])
-                        if '.' in mask_val:  # Subnet mask format
+            for rank, value in sorted(masks):
+                try:
+                    mask_val = str(value)
+                    if '.' in mask_val:  # Subnet mask format
+                        prefix_length = _NETMASK_PREFIXES.get(mask_val)
+                        if prefix_length is None:
+                            # Non-contiguous or unusual mask: count the set bits
                             prefix_length = sum(bin(int(x)).count('1') for x in mask_val.split('.'))
-                        else:  # Prefix length format
-                            prefix_length = int(mask_val)
-                        break
-                    except:
-                        continue
+                    else:  # Prefix length format
+                        prefix_length = int(mask_val)
+                    break
+                except:
+                    continue
             
             if prefix_length is None:
                 prefix_length = 32  # Default for host routes
         
-        # Find other fields
-        next_hop = None
-        for field in nh_fields:
-            if field in data and data[field]:
-                next_hop = str(data[field]).strip()
-                break
-        
-        interface = None
-        for field in int_fields:
-            if field in data and data[field]:
-                interface = str(data[field]).strip()
-                break
-        
-        protocol = None
-        for field in proto_fields:
-            if field in data and data[field]:
-                protocol = str(data[field]).strip()
-                break
+        next_hop = values.get('next_hop')
+        interface = values.get('interface')
+        protocol = values.get('protocol')
         
         # Extract metric and admin distance if available
         metric = data.get('metric') or data.get('cost')
@@ -285,37 +434,14 @@ class RouteParser:
         )
     
     @staticmethod
-    def _parse_cisco_route_line(line: str) -> Optional[Route]:
-        """Parse Cisco-style route output line including Nexus format"""
-        # Match patterns like:
-        # 10.1.1.0/24 via 192.168.1.1, Ethernet1/1
-        # O 172.16.0.0/16 [110/20] via 10.0.0.1, 00:30:17, FastEthernet0/0
-        # 10.7.248.0/30, ubest/mbest: 2/0
-        #     *via 10.249.16.64, eth1/54.12, [115/64], 04w00d, isis-isis_infra, isis-l1-ext
-        
-        # First check if this is a Nexus route header (destination line)
-        nexus_route_header = r'^(?P<dest>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+),\s+ubest/mbest:\s*\d+/\d+'
-        match = re.match(nexus_route_header, line.strip())
-        if match:
-            groups = match.groupdict()
-            return Route(
-                destination=groups['dest'],
-                prefix_length=int(groups['prefix']),
-                raw_line=line
-            )
-        
-        # Then check for Nexus via lines (next-hop details)
-        nexus_via_patterns = [
-            # *via 10.249.16.64, eth1/54.12, [115/64], 04w00d, isis-isis_infra, isis-l1-ext
-            r'^\s*\*via\s+(?P<nh>\d+\.\d+\.\d+\.\d+)(?:%(?P<vrf>\S+))?,\s*(?P<intf>\S+),\s*\[(?P<ad>\d+)/(?P<metric>\d+)\],\s*(?P<age>\S+),\s*(?P<protocol>\S+)',
-            # *via 10.249.248.0%overlay-1, [1/0], 28w06d, bgp-64512, internal, tag 64512
-            r'^\s*\*via\s+(?P<nh>\d+\.\d+\.\d+\.\d+)(?:%(?P<vrf>\S+))?,\s*\[(?P<ad>\d+)/(?P<metric>\d+)\],\s*(?P<age>\S+),\s*(?P<protocol>\S+)',
-            # *via 192.168.63.253, vlan27, [0/0], 3y34w, local, local
-            r'^\s*\*via\s+(?P<nh>\d+\.\d+\.\d+\.\d+),\s*(?P<intf>\S+),\s*\[(?P<ad>\d+)/(?P<metric>\d+)\],\s*(?P<age>\S+),\s*(?P<protocol>\S+)',
-        ]
-        
-        for pattern in nexus_via_patterns:
-            match = re.search(pattern, line)
+    def _parse_nexus_route_line(line: str) -> Optional[Route]:
+        """Parse a Nexus route header or via line"""
+        # Dispatch on the shape of the line so that each Nexus line is only
+        # run through the one pattern that can match it
+        stripped = line.strip()
+        if stripped.startswith('*via'):
+            # Nexus via lines (next-hop details)
+            match = _NEXUS_VIA_RE.match(stripped)
             if match:
                 groups = match.groupdict()
                 return Route(
@@ -328,19 +454,37 @@ class RouteParser:
                     admin_distance=int(groups['ad']) if groups.get('ad') else None,
                     raw_line=line
                 )
+        else:
+            # Nexus route header (destination line)
+            match = _NEXUS_HEADER_RE.match(stripped)
+            if match:
+                groups = match.groupdict()
+                return Route(
+                    destination=groups['dest'],
+                    prefix_length=int(groups['prefix']),
+                    raw_line=line
+                )
         
+        return None
+    
+    @staticmethod
+    def _parse_cisco_route_line(line: str) -> Optional[Route]:
+        """Parse Cisco-style route output line including Nexus format"""
+        # Match patterns like:
+        # 10.1.1.0/24 via 192.168.1.1, Ethernet1/1
+        # O 172.16.0.0/16 [110/20] via 10.0.0.1, 00:30:17, FastEthernet0/0
+        # 10.7.248.0/30, ubest/mbest: 2/0
+        #     *via 10.249.16.64, eth1/54.12, [115/64], 04w00d, isis-isis_infra, isis-l1-ext
+        
+        return (RouteParser._parse_nexus_route_line(line) or
+                RouteParser._parse_legacy_route_line(line))
+    
+    @staticmethod
+    def _parse_legacy_route_line(line: str) -> Optional[Route]:
+        """Parse IOS-style route output line"""
         # Legacy patterns for other Cisco formats
-        patterns = [
-            # Standard format: network/prefix via next_hop, interface
-            r'(?P<protocol>[A-Z*+]?\s*)?(?P<dest>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)\s+via\s+(?P<nh>\d+\.\d+\.\d+\.\d+)(?:,\s*(?P<intf>\S+))?',
-            # Alternative format with brackets: network/prefix [AD/metric] via next_hop, interface
-            r'(?P<protocol>[A-Z*+]?\s*)?(?P<dest>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)\s+\[(?P<ad>\d+)/(?P<metric>\d+)\]\s+via\s+(?P<nh>\d+\.\d+\.\d+\.\d+)(?:,\s*\d+:\d+:\d+,\s*(?P<intf>\S+))?',
-            # Simple format: network/prefix next_hop
-            r'(?P<dest>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)\s+(?P<nh>\d+\.\d+\.\d+\.\d+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, line)
+        for pattern in _CISCO_ROUTE_RES:
+            match = pattern.search(line)
             if match:
                 groups = match.groupdict()
                 return Route(
@@ -360,8 +504,7 @@ class RouteParser:
     def _parse_generic_route_line(line: str) -> Optional[Route]:
         """Parse generic route line formats"""
         # Try to extract IP addresses and infer structure
-        ip_pattern = r'\b(?:\d{1,3}\.){3}\d{1,3}(?:/\d{1,2})?\b'
-        ips = re.findall(ip_pattern, line)
+        ips = _GENERIC_IP_RE.findall(line)
         
         if len(ips) >= 1:
             dest_ip = ips[0]
@@ -393,62 +536,49 @@ class RouteComparator:
         self.all_pre_routes = pre_routes
         self.all_post_routes = post_routes
         
-        # Create dictionaries with subnet as key, but keep track of all routes
+        # Create dictionaries keyed by (network, prefix), but keep track of all routes
         # In case of multiple routes to same destination, keep the first one for comparison
         # but store all routes for detailed analysis
-        self.pre_routes = {}
-        self.pre_route_details = {}
+        self.pre_route_details = defaultdict(list)
         for route in pre_routes:
-            if route.subnet not in self.pre_routes:
-                self.pre_routes[route.subnet] = route
-                self.pre_route_details[route.subnet] = [route]
-            else:
-                self.pre_route_details[route.subnet].append(route)
+            self.pre_route_details[route._key].append(route)
+        self.pre_routes = {key: routes[0] for key, routes in self.pre_route_details.items()}
         
-        self.post_routes = {}
-        self.post_route_details = {}
+        self.post_route_details = defaultdict(list)
         for route in post_routes:
-            if route.subnet not in self.post_routes:
-                self.post_routes[route.subnet] = route
-                self.post_route_details[route.subnet] = [route]
-            else:
-                self.post_route_details[route.subnet].append(route)
+            self.post_route_details[route._key].append(route)
+        self.post_routes = {key: routes[0] for key, routes in self.post_route_details.items()}
         
         self.pre_subnets = set(self.pre_routes.keys())
         self.post_subnets = set(self.post_routes.keys())
     
     def compare(self) -> Dict:
         """Perform comprehensive comparison"""
-        # Use pre-change subnets as the base
-        base_subnets = self.pre_subnets
+        # Use pre-change subnets as the base; the set algebra runs in C
+        pre_subnets = self.pre_subnets
+        post_subnets = self.post_subnets
         
         # Categorize changes
-        missing_routes = []  # Routes in pre but not in post
-        added_routes = []    # Routes in post but not in pre
+        # Routes in pre but not in post
+        missing_routes = [self.pre_routes[key] for key in pre_subnets - post_subnets]
+        # Routes in post but not in pre
+        added_routes = [self.post_routes[key] for key in post_subnets - pre_subnets]
         changed_routes = []  # Routes that exist in both but with differences
         unchanged_routes = [] # Routes that are identical
         
-        # Check each subnet from pre-change file
-        for subnet in base_subnets:
-            pre_route = self.pre_routes[subnet]
-            
-            if subnet not in self.post_routes:
-                missing_routes.append(pre_route)
+        # Only subnets present on both sides need a route-level comparison
+        for key in pre_subnets & post_subnets:
+            pre_route = self.pre_routes[key]
+            post_route = self.post_routes[key]
+            if self._routes_equal(pre_route, post_route):
+                unchanged_routes.append(pre_route)
             else:
-                post_route = self.post_routes[subnet]
-                if self._routes_equal(pre_route, post_route):
-                    unchanged_routes.append(pre_route)
-                else:
-                    changed_routes.append({
-                        'subnet': subnet,
-                        'pre': pre_route,
-                        'post': post_route,
-                        'changes': self._get_route_differences(pre_route, post_route)
-                    })
-        
-        # Find routes that were added (in post but not in pre)
-        for subnet in self.post_subnets - self.pre_subnets:
-            added_routes.append(self.post_routes[subnet])
+                changed_routes.append({
+                    'subnet': pre_route.subnet,
+                    'pre': pre_route,
+                    'post': post_route,
+                    'changes': self._get_route_differences(pre_route, post_route)
+                })
         
         return {
             'summary': {
@@ -468,26 +598,22 @@ class RouteComparator:
     def _routes_equal(self, route1: Route, route2: Route) -> bool:
         """Check if two routes are functionally equal"""
         # For routes with same destination, we need to compare all next-hops
-        subnet = route1.subnet
-        if subnet in self.pre_route_details and subnet in self.post_route_details:
-            pre_routes = self.pre_route_details[subnet]
-            post_routes = self.post_route_details[subnet]
+        key = route1._key
+        if key in self.pre_route_details and key in self.post_route_details:
+            pre_routes = self.pre_route_details[key]
+            post_routes = self.post_route_details[key]
             
             # Compare the number of routes to the same destination
             if len(pre_routes) != len(post_routes):
                 return False
             
-            # Create sets of next-hops for comparison
-            pre_nexthops = set()
-            post_nexthops = set()
+            # Single-path routes (the common case) need no set building
+            if len(pre_routes) == 1:
+                return pre_routes[0]._nh_key == post_routes[0]._nh_key
             
-            for route in pre_routes:
-                nh_key = (route.next_hop, route.interface, route.protocol)
-                pre_nexthops.add(nh_key)
-            
-            for route in post_routes:
-                nh_key = (route.next_hop, route.interface, route.protocol)
-                post_nexthops.add(nh_key)
+            # Create sets of next-hops for comparison
+            pre_nexthops = {route._nh_key for route in pre_routes}
+            post_nexthops = {route._nh_key for route in post_routes}
             
             return pre_nexthops == post_nexthops
         
@@ -501,27 +627,19 @@ class RouteComparator:
     def _get_route_differences(self, pre_route: Route, post_route: Route) -> List[str]:
         """Get list of differences between two routes"""
         differences = []
-        subnet = pre_route.subnet
+        key = pre_route._key
         
         # For routes with multiple next-hops, show detailed differences
-        if subnet in self.pre_route_details and subnet in self.post_route_details:
-            pre_routes = self.pre_route_details[subnet]
-            post_routes = self.post_route_details[subnet]
+        if key in self.pre_route_details and key in self.post_route_details:
+            pre_routes = self.pre_route_details[key]
+            post_routes = self.post_route_details[key]
             
             if len(pre_routes) != len(post_routes):
                 differences.append(f"Number of paths: {len(pre_routes)} -> {len(post_routes)}")
             
             # Create sets for comparison
-            pre_nexthops = set()
-            post_nexthops = set()
-            
-            for route in pre_routes:
-                nh_key = (route.next_hop, route.interface, route.protocol)
-                pre_nexthops.add(nh_key)
-            
-            for route in post_routes:
-                nh_key = (route.next_hop, route.interface, route.protocol)
-                post_nexthops.add(nh_key)
+            pre_nexthops = {route._nh_key for route in pre_routes}
+            post_nexthops = {route._nh_key for route in post_routes}
             
             # Find removed and added next-hops
             removed_nexthops = pre_nexthops - post_nexthops
@@ -601,8 +719,17 @@ def print_comparison_report(comparison: Dict):
 def save_comparison_report(comparison: Dict, output_file: str):
     """Save comparison report to JSON file"""
     # Convert Route objects to dictionaries for JSON serialization
+    # Built field by field: asdict() would deep-copy every route
     def route_to_dict(route):
-        return {k: v for k, v in asdict(route).items() if k != 'raw_line'}
+        return {
+            'destination': route.destination,
+            'prefix_length': route.prefix_length,
+            'next_hop': route.next_hop,
+            'interface': route.interface,
+            'protocol': route.protocol,
+            'metric': route.metric,
+            'admin_distance': route.admin_distance
+        }
     
     json_data = {
         'summary': comparison['summary'],
@@ -626,6 +753,35 @@ def save_comparison_report(comparison: Dict, output_file: str):
     print(f"\nDetailed report saved to: {output_file}")
 
 
+def parse_route_files(pre_file: str, post_file: str) -> Tuple[List[Route], List[Route]]:
+    """Parse the pre-change and post-change route files.
+    
+    The files are independent, so large inputs are parsed in two worker
+    processes when more than one CPU is available.
+    """
+    sizes = [Path(p).stat().st_size for p in (pre_file, post_file) if Path(p).exists()]
+    if (os.cpu_count() or 1) > 1 and sum(sizes) >= _PARALLEL_PARSE_MIN_BYTES:
+        print(f"Parsing pre-change routes from: {pre_file}")
+        print(f"Parsing post-change routes from: {post_file}")
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pre_future = executor.submit(RouteParser.parse_file, pre_file)
+            post_future = executor.submit(RouteParser.parse_file, post_file)
+            pre_routes = pre_future.result()
+            post_routes = post_future.result()
+        print(f"Found {len(pre_routes)} pre-change routes")
+        print(f"Found {len(post_routes)} post-change routes")
+        return pre_routes, post_routes
+    
+    print(f"Parsing pre-change routes from: {pre_file}")
+    pre_routes = RouteParser.parse_file(pre_file)
+    print(f"Found {len(pre_routes)} pre-change routes")
+    
+    print(f"Parsing post-change routes from: {post_file}")
+    post_routes = RouteParser.parse_file(post_file)
+    print(f"Found {len(post_routes)} post-change routes")
+    return pre_routes, post_routes
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Compare pre-change and post-change Cisco ACI route files"
@@ -640,13 +796,7 @@ def main():
     
     try:
         # Parse route files
-        print(f"Parsing pre-change routes from: {args.pre_file}")
-        pre_routes = RouteParser.parse_file(args.pre_file)
-        print(f"Found {len(pre_routes)} pre-change routes")
-        
-        print(f"Parsing post-change routes from: {args.post_file}")
-        post_routes = RouteParser.parse_file(args.post_file)
-        print(f"Found {len(post_routes)} post-change routes")
+        pre_routes, post_routes = parse_route_files(args.pre_file, args.post_file)
         
         if not pre_routes:
             print("WARNING: No routes found in pre-change file")
@@ -677,9 +827,9 @@ def main():
             missing_subnets = comparator.pre_subnets - comparator.post_subnets
             if missing_subnets:
                 print(f"DEBUG: Examples of missing subnets:")
-                for subnet in list(missing_subnets)[:5]:
-                    route = comparator.pre_routes[subnet]
-                    print(f"  {subnet} -> {route.next_hop} [{route.protocol}]")
+                for key in list(missing_subnets)[:5]:
+                    route = comparator.pre_routes[key]
+                    print(f"  {route.subnet} -> {route.next_hop} [{route.protocol}]")
         
         # Print report
         if not args.quiet: